@@ -6,11 +6,57 @@ This module provides the main compliance checking functionality
 for EU Data Act (Regulation 2023/2854) contracts.
 """
 
-from rdflib import Graph, Namespace
+from rdflib import Graph, Namespace, URIRef
+from rdflib.graph import ReadOnlyGraphAggregate
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 from datetime import datetime
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import hashlib
 import json
+import os
+import sys
+
+# orjson is optional; the stdlib fallback keeps the same bytes-based API
+try:
+    import orjson
+    
+    def dump_json(data, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes (2-space indent if requested)"""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    
+    def write_json(data, path, indent: bool = False) -> None:
+        """Write JSON to a file as bytes, with no intermediate str"""
+        Path(path).write_bytes(dump_json(data, indent=indent))
+    
+    load_json = orjson.loads
+except ImportError:
+    def dump_json(data, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes (2-space indent if requested)"""
+        return json.dumps(
+            data, indent=2 if indent else None, ensure_ascii=False
+        ).encode('utf-8')
+    
+    def write_json(data, path, indent: bool = False) -> None:
+        """Stream JSON to a file chunk by chunk instead of building one str"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+    
+    load_json = json.loads
+
+# Optional Rust-backed SPARQL store; falls back to rdflib's in-memory store
+try:
+    import oxrdflib  # noqa: F401  (registers the "Oxigraph" store plugin)
+    GRAPH_STORE = "Oxigraph"
+except ImportError:
+    GRAPH_STORE = "default"
 
 # Define namespaces
 DATAACT = Namespace("http://www.semanticweb.org/dataact#")
@@ -19,22 +65,157 @@ ODRL = Namespace("https://www.w3.org/ns/odrl/2/")
 RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
 RDFS = Namespace("http://www.w3.org/2000/01/rdf-schema#")
 
+# Prefixes available to every compliance query
+QUERY_NAMESPACES = {
+    "dataact": DATAACT,
+    "dpv": DPV,
+    "odrl": ODRL,
+    "rdf": RDF,
+    "rdfs": RDFS,
+}
+
+# Contract type detection: one prepared ASK, bound to each sharing class
+CONTRACT_TYPE_QUERY = prepareQuery(
+    "ASK { ?s a ?sharingClass . FILTER(isIRI(?s)) }"
+)
+CONTRACT_TYPE_CLASSES = [
+    ("B2C", DATAACT.B2CDataSharing),
+    ("B2B", DATAACT.B2BDataSharing),
+    ("B2G", DATAACT.B2GDataSharing),
+]
+
+# Read buffer for streaming RDF files into the parser
+PARSE_BUFFER_SIZE = 1 << 20
+
+# Bump when report contents or violation extraction change, so cached
+# reports written by older code are not served
+CACHE_VERSION = 1
+
+# Cached reports kept on disk; the least recently used are evicted
+CACHE_MAX_ENTRIES = 256
+
+
+@functools.lru_cache(maxsize=512)
+def _contract_type_from_stem(stem: str) -> str:
+    """Map a lowercased filename stem to its contract type"""
+    if "b2c" in stem:
+        return "B2C"
+    if "b2b" in stem:
+        return "B2B"
+    if "b2g" in stem:
+        return "B2G"
+    return "UNKNOWN"
+
+
+@functools.lru_cache(maxsize=4096)
+def _uri_str(uri: URIRef) -> str:
+    """Interned string form of a URI; the same IRIs recur across violations"""
+    return sys.intern(str(uri))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_query(query_path: str, mtime_ns: int) -> Tuple[str, Query]:
+    """
+    Read and prepare a SPARQL query file once per process and version.
+    
+    Shared by every checker instance, so re-creating a checker (CLI runs,
+    fresh dashboard sessions) does not re-parse the query files. The
+    modification time is part of the key and prepare_query passes the
+    current one on every call, so edits reach live checkers too; the
+    bounded size lets superseded versions age out.
+    """
+    with open(query_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return text, prepareQuery(text, initNs=QUERY_NAMESPACES)
+
+
+def contract_type_from_name(contract_path: str) -> str:
+    """
+    Detect contract type (B2C, B2B, B2G) from the contract filename.
+    
+    Args:
+        contract_path: Path to contract OWL file
+        
+    Returns:
+        Contract type, or 'UNKNOWN' if the filename has no marker
+    """
+    return _contract_type_from_stem(Path(contract_path).stem.lower())
+
+
+def compute_fingerprint(*paths) -> str:
+    """
+    Fingerprint input files by name, size and modification time.
+    
+    Directories contribute every file they contain. Only stat data is
+    read, so this is a cheap check for whether inputs changed since a
+    report was produced.
+    
+    Args:
+        *paths: Files or directories to fingerprint
+        
+    Returns:
+        Hex digest of the sorted (name, size, mtime) entries
+    """
+    entries = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries.append((f"{path.name}/{entry.name}", stat.st_size, stat.st_mtime_ns))
+        elif path.exists():
+            stat = path.stat()
+            entries.append((path.name, stat.st_size, stat.st_mtime_ns))
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for name, size, mtime_ns in sorted(entries):
+        digest.update(f"{name}\0{size}\0{mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
 
 class ComplianceResult:
-    """Represents the result of a compliance check"""
+    """
+    Represents the result of a compliance check.
+    
+    Violations are stored column-wise (one list per result variable) so
+    they can be handed to pandas without per-row dict materialization.
+    """
+    
+    __slots__ = (
+        'article_id', 'article_name', 'compliant', 'columns',
+        'violation_count', 'execution_time', 'error',
+    )
     
     def __init__(self, article_id: str, article_name: str):
         self.article_id = article_id
         self.article_name = article_name
         self.compliant = True
-        self.violations = []
+        self.columns: Dict[str, list] = {}
+        self.violation_count = 0
         self.execution_time = 0.0
         self.error = None
     
     def add_violation(self, violation: Dict):
         """Add a violation to the result"""
         self.compliant = False
-        self.violations.append(violation)
+        for key in violation:
+            if key not in self.columns:
+                self.columns[key] = [None] * self.violation_count
+        for key, column in self.columns.items():
+            column.append(violation.get(key))
+        self.violation_count += 1
+    
+    @property
+    def violations(self) -> List[Dict]:
+        """Violations as a list of dicts (unbound fields omitted)"""
+        if not self.columns:
+            return [{} for _ in range(self.violation_count)]
+        names = list(self.columns)
+        return [
+            {name: value for name, value in zip(names, row) if value is not None}
+            for row in zip(*self.columns.values())
+        ]
     
     def to_dict(self) -> Dict:
         """Convert result to dictionary"""
@@ -42,16 +223,32 @@ class ComplianceResult:
             'article_id': self.article_id,
             'article_name': self.article_name,
             'compliant': self.compliant,
-            'violation_count': len(self.violations),
+            'violation_count': self.violation_count,
             'violations': self.violations,
             'execution_time_ms': round(self.execution_time * 1000, 2),
             'error': self.error
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ComplianceResult':
+        """Rebuild a result from its dictionary form"""
+        result = cls(data['article_id'], data['article_name'])
+        for violation in data['violations']:
+            result.add_violation(violation)
+        result.compliant = data['compliant']
+        result.execution_time = data['execution_time_ms'] / 1000
+        result.error = data['error']
+        return result
 
 
 class ContractComplianceReport:
     """Represents a complete compliance report for a contract"""
     
+    __slots__ = (
+        'contract_name', 'contract_path', 'contract_type', 'checks',
+        'timestamp', 'total_triples', 'load_error',
+    )
+    
     def __init__(self, contract_name: str, contract_path: str):
         self.contract_name = contract_name
         self.contract_path = contract_path
@@ -76,7 +273,7 @@ class ContractComplianceReport:
     def total_violations(self) -> int:
         """Count total violations across all checks"""
         return sum(
-            len(check.violations) 
+            check.violation_count 
             for check in self.checks.values()
         )
     
@@ -101,8 +298,26 @@ class ContractComplianceReport:
             'load_error': self.load_error
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ContractComplianceReport':
+        """Rebuild a report from its dictionary form"""
+        report = cls(data['contract_name'], data['contract_path'])
+        report.contract_type = data['contract_type']
+        report.timestamp = datetime.fromisoformat(data['timestamp'])
+        report.total_triples = data['total_triples']
+        report.checks = {
+            article_id: ComplianceResult.from_dict(check)
+            for article_id, check in data['checks'].items()
+        }
+        report.load_error = data['load_error']
+        return report
+    
     def to_json(self, indent=2) -> str:
         """Convert report to JSON string"""
+        # dump_json covers the common compact and 2-space layouts; any
+        # other indent goes through the stdlib to keep its meaning
+        if indent is None or indent == 2:
+            return dump_json(self.to_dict(), indent=indent is not None).decode('utf-8')
         return json.dumps(self.to_dict(), indent=indent)
 
 
@@ -116,16 +331,22 @@ class DataActComplianceChecker:
     
     def __init__(self, 
                  base_ontology_path: str = "dataact-ontology.owl",
-                 queries_dir: str = "queries"):
+                 queries_dir: str = "queries",
+                 cache_dir: Optional[str] = ".compliance_cache",
+                 article_mappings: Optional[Dict[str, List[Tuple[str, str, str]]]] = None):
         """
         Initialize the compliance checker.
         
         Args:
             base_ontology_path: Path to the base Data Act ontology
             queries_dir: Directory containing SPARQL query files
+            cache_dir: Directory for cached contract reports (None disables)
+            article_mappings: Optional {contract_type: [(article_id,
+                article_name, query_file), ...]} replacing the default checks
         """
         self.base_ontology_path = Path(base_ontology_path)
         self.queries_dir = Path(queries_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         
         # Validate paths
         if not self.base_ontology_path.exists():
@@ -138,43 +359,138 @@ class DataActComplianceChecker:
             )
         
         # Define article mappings
-        self.article_mappings = {
-            'B2C': [
-                ('4.1', 'User Access Rights', 'query-4.1.sparql'),
-            ],
-            'B2B': [
-                ('8.6', 'Trade Secret Exception', 'query-8.6.sparql'),
-            ],
-            'B2G': [
-                ('19.2a', 'Competitive Use Prohibition', 'query-19.2.a.sparql'),
-            ]
-        }
+        if article_mappings is not None:
+            self.article_mappings = article_mappings
+        else:
+            self.article_mappings = {
+                'B2C': [
+                    ('4.1', 'User Access Rights', 'query-4.1.sparql'),
+                ],
+                'B2B': [
+                    ('8.6', 'Trade Secret Exception', 'query-8.6.sparql'),
+                ],
+                'B2G': [
+                    ('19.2a', 'Competitive Use Prohibition', 'query-19.2.a.sparql'),
+                ]
+            }
+        
+        # Parse the base ontology once; contracts are layered on top of it.
+        # Both it and the inputs digest are rebuilt if the inputs change
+        self._query_texts = {}
+        self._base_graph = None
+        self._base_stamp = None
+        self._inputs_digest = None
+        self._inputs_stamp = None
+        self._refresh_inputs()
+    
+    @staticmethod
+    def _new_graph(store: str = "default") -> Graph:
+        """Create an empty graph with the checker namespaces bound"""
+        g = Graph(store=store)
+        g.bind("dataact", DATAACT)
+        g.bind("dpv", DPV)
+        g.bind("odrl", ODRL)
+        g.bind("rdf", RDF)
+        g.bind("rdfs", RDFS)
+        return g
+    
+    @staticmethod
+    def _parse_file(g: Graph, path, format: str):
+        """
+        Stream-parse an RDF file into a graph through a buffered reader.
+        
+        Handing rdflib an open binary stream skips its URL/location
+        resolution; the file URI is passed as publicID so relative IRIs
+        resolve exactly as when parsing by path.
+        """
+        path = Path(path)
+        with open(path, 'rb', buffering=PARSE_BUFFER_SIZE) as f:
+            g.parse(source=f, format=format, publicID=path.resolve().as_uri())
+    
+    def _fast_base_path(self) -> Optional[Path]:
+        """
+        Get the N-Triples copy of the base ontology for its current contents.
+        
+        Returns:
+            Path inside cache_dir, or None if caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        self._hash_file(self.base_ontology_path, digest)
+        return self.cache_dir / f"base-{digest.hexdigest()}.nt"
+    
+    def _load_base_graph(self) -> Graph:
+        """
+        Parse the base ontology into a graph shared by all contract checks.
+        
+        RDF/XML is the slowest format rdflib parses, so the first load
+        writes an N-Triples copy to the cache directory and later loads
+        (including worker processes) parse that instead. Copies of earlier
+        ontology versions are removed when a new one is written.
+        
+        Returns:
+            Graph containing only the base ontology triples
+        """
+        g = self._new_graph()
+        fast_path = self._fast_base_path()
+        
+        if fast_path is not None and fast_path.exists():
+            self._parse_file(g, fast_path, "nt")
+            return g
+        
+        self._parse_file(g, self.base_ontology_path, "xml")
+        
+        if fast_path is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = fast_path.with_suffix(f".{os.getpid()}.tmp")
+                g.serialize(destination=str(tmp_path), format="nt", encoding="utf-8")
+                os.replace(tmp_path, fast_path)
+            except OSError:
+                return g
+            for stale_path in self.cache_dir.glob("base-*.nt"):
+                if stale_path != fast_path:
+                    try:
+                        stale_path.unlink()
+                    except OSError:
+                        pass
+        return g
     
     def load_contract(self, contract_path: str) -> Tuple[Graph, Optional[str]]:
         """
         Load contract and base ontology into RDF graph.
         
+        The base ontology is parsed once at initialization. Each contract
+        is parsed into its own graph and queried through a read-only union
+        with the shared base graph, so the base triples are never copied
+        and checks stay isolated from each other. The union is not a set
+        union, so contract triples already in the base (repeated ontology
+        headers or axioms) are dropped first; otherwise they would count
+        twice in len() and match twice in queries.
+        
         Args:
             contract_path: Path to contract OWL file
             
         Returns:
             Tuple of (graph, error_message)
         """
-        g = Graph()
+        if GRAPH_STORE == "Oxigraph":
+            # Oxigraph can only evaluate natively over its own store
+            g = self._new_graph(GRAPH_STORE)
+            g += self._base_graph
+        else:
+            g = self._new_graph()
         
         try:
-            # Bind namespaces
-            g.bind("dataact", DATAACT)
-            g.bind("dpv", DPV)
-            g.bind("odrl", ODRL)
-            g.bind("rdf", RDF)
-            g.bind("rdfs", RDFS)
-            
-            # Load base ontology
-            g.parse(str(self.base_ontology_path), format="xml")
-            
             # Load contract
-            g.parse(contract_path, format="xml")
+            self._parse_file(g, contract_path, "xml")
+            
+            if GRAPH_STORE != "Oxigraph":
+                base = self._base_graph
+                for triple in [t for t in g if t in base]:
+                    g.remove(triple)
+                g = ReadOnlyGraphAggregate([base, g])
             
             return g, None
             
@@ -187,28 +503,44 @@ class DataActComplianceChecker:
         """
         Detect contract type (B2C, B2B, B2G) safely, avoiding ontology contamination.
         """
-        PREFIX = "PREFIX dataact: <http://www.semanticweb.org/dataact#> "
-
         # Try pattern detection by filename first
         if contract_path:
-            name = Path(contract_path).stem.lower()
-            if "b2c" in name:
-                return "B2C"
-            if "b2b" in name:
-                return "B2B"
-            if "b2g" in name:
-                return "B2G"
-
-        # Fallback: query actual individuals (not class definitions)
-        for t, q in [
-            ("B2C", "ASK { ?s a dataact:B2CDataSharing . FILTER(isIRI(?s)) }"),
-            ("B2B", "ASK { ?s a dataact:B2BDataSharing . FILTER(isIRI(?s)) }"),
-            ("B2G", "ASK { ?s a dataact:B2GDataSharing . FILTER(isIRI(?s)) }"),
-        ]:
-            if g.query(PREFIX + q).askAnswer:
+            contract_type = contract_type_from_name(contract_path)
+            if contract_type != "UNKNOWN":
+                return contract_type
+
+        # Fallback: query actual individuals (not class definitions),
+        # reusing one prepared ASK with the sharing class bound per type
+        for t, sharing_class in CONTRACT_TYPE_CLASSES:
+            result = g.query(
+                CONTRACT_TYPE_QUERY,
+                initBindings={"sharingClass": sharing_class},
+            )
+            if result.askAnswer:
                 return t
         return "UNKNOWN"
     
+    def prepare_query(self, query_file: str) -> Query:
+        """
+        Parse a SPARQL query file, reusing the prepared query until the
+        file is modified.
+        
+        Args:
+            query_file: SPARQL query filename
+            
+        Returns:
+            Prepared rdflib Query object
+            
+        Raises:
+            FileNotFoundError: If the query file does not exist
+        """
+        query_path = self.queries_dir / query_file
+        text, query = _compile_query(
+            str(query_path), query_path.stat().st_mtime_ns
+        )
+        self._query_texts[query_file] = text
+        return query
+    
     def execute_check(self, 
                       g: Graph, 
                       article_id: str, 
@@ -227,48 +559,191 @@ class DataActComplianceChecker:
             ComplianceResult object
         """
         result = ComplianceResult(article_id, article_name)
-        start_time = datetime.now()
+        start_time = perf_counter()
         
         try:
-            # Load query
-            query_path = self.queries_dir / query_file
-            if not query_path.exists():
+            # Get prepared query
+            try:
+                query = self.prepare_query(query_file)
+            except FileNotFoundError:
                 result.error = f"Query file not found: {query_file}"
                 return result
             
-            with open(query_path, 'r', encoding='utf-8') as f:
-                query = f.read()
+            # Oxigraph only evaluates query strings natively; prepared
+            # queries would fall back to rdflib's evaluator
+            if GRAPH_STORE == "Oxigraph":
+                query = self._query_texts[query_file]
             
             # Execute query
             query_results = g.query(query)
             
             # Process results
+            var_names = [str(var) for var in query_results.vars]
             for row in query_results:
-                violation = {}
-                
-                # Extract all fields from result row
-                for var in query_results.vars:
-                    value = getattr(row, str(var), None)
-                    if value is not None:
-                        violation[str(var)] = str(value)
-                
+                # Extract all bound fields from result row
+                violation = {
+                    name: _uri_str(value) if isinstance(value, URIRef) else str(value)
+                    for name, value in zip(var_names, row)
+                    if value is not None
+                }
                 result.add_violation(violation)
             
         except Exception as e:
             result.error = f"Error executing query: {e}"
         
         finally:
-            end_time = datetime.now()
-            result.execution_time = (end_time - start_time).total_seconds()
+            result.execution_time = perf_counter() - start_time
         
         return result
     
+    @staticmethod
+    def _hash_file(path: Path, digest) -> None:
+        """Feed a file's contents into a hashlib digest"""
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+    
+    def _query_files(self) -> List[str]:
+        """Sorted names of all query files used by the article mappings"""
+        return sorted({
+            query_file
+            for checks in self.article_mappings.values()
+            for _, _, query_file in checks
+        })
+    
+    @staticmethod
+    def _stat_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Size and modification time of a file, or None if it is missing"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+    
+    def _refresh_inputs(self):
+        """
+        Reload derived state when the ontology, queries or mappings change.
+        
+        Only stat calls are made when nothing changed, so this runs before
+        every check; a long-lived checker (e.g. one kept per dashboard
+        session) then never serves results for outdated inputs.
+        """
+        base_stamp = self._stat_stamp(self.base_ontology_path)
+        query_files = self._query_files()
+        inputs_stamp = (
+            base_stamp,
+            repr(self.article_mappings),
+            tuple(self._stat_stamp(self.queries_dir / q) for q in query_files),
+        )
+        if inputs_stamp == self._inputs_stamp:
+            return
+        
+        if base_stamp != self._base_stamp or self._base_graph is None:
+            self._base_graph = self._load_base_graph()
+            self._base_stamp = base_stamp
+        
+        # Pre-compile SPARQL queries; failures are reported by execute_check
+        for query_file in query_files:
+            try:
+                self.prepare_query(query_file)
+            except Exception:
+                pass
+        
+        # Digest of everything besides the contract that affects a report
+        self._inputs_digest = self._compute_inputs_digest()
+        self._inputs_stamp = inputs_stamp
+    
+    def _compute_inputs_digest(self) -> str:
+        """
+        Hash the cache version, article mappings, base ontology and all
+        mapped query files.
+        
+        Returns:
+            Hex digest shared by the cache keys of every contract
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"v{CACHE_VERSION}".encode('ascii'))
+        digest.update(repr(self.article_mappings).encode('utf-8'))
+        self._hash_file(self.base_ontology_path, digest)
+        for query_file in self._query_files():
+            digest.update(query_file.encode('utf-8'))
+            query_path = self.queries_dir / query_file
+            if query_path.exists():
+                self._hash_file(query_path, digest)
+        return digest.hexdigest()
+    
+    def _cache_path(self, contract_path: str) -> Optional[Path]:
+        """
+        Get the cache file for a contract's current contents and location.
+        
+        The resolved path is part of the key: the contract type is taken
+        from the file name and relative IRIs resolve against the file URI,
+        so the same bytes elsewhere can produce a different report.
+        
+        Args:
+            contract_path: Path to contract OWL file
+            
+        Returns:
+            Path of the cache entry, or None if caching is unavailable
+        """
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._inputs_digest.encode('ascii'))
+        try:
+            path = Path(contract_path).resolve()
+            digest.update(str(path).encode('utf-8'))
+            self._hash_file(path, digest)
+        except OSError:
+            return None
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+    
+    def _write_cache(self, cache_path: Path, report: ContractComplianceReport):
+        """Atomically store a report in the cache, ignoring write failures"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(dump_json(report.to_dict()))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            return
+        self._evict_cache()
+    
+    def _evict_cache(self):
+        """Remove the least recently used reports beyond CACHE_MAX_ENTRIES"""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime_ns, entry.path)
+                    for entry in it
+                    if entry.name.endswith('.json')
+                ]
+        except OSError:
+            return
+        if len(entries) <= CACHE_MAX_ENTRIES:
+            return
+        entries.sort()
+        for _, path in entries[:-CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     def check_contract(self, 
                        contract_path: str,
                        contract_name: Optional[str] = None) -> ContractComplianceReport:
         """
         Check a single contract for compliance.
         
+        Reports are cached on disk keyed by the resolved path and contents
+        of the contract, the base ontology and the query files, the article
+        mappings and CACHE_VERSION, so unchanged contracts are not parsed
+        or queried again. A cache hit is stamped with the current time;
+        its per-check execution times are those of the original run. At
+        most CACHE_MAX_ENTRIES reports are kept, least recently used first
+        out.
+        
         Args:
             contract_path: Path to contract OWL file
             contract_name: Optional human-readable name
@@ -279,8 +754,51 @@ class DataActComplianceChecker:
         if contract_name is None:
             contract_name = Path(contract_path).stem
         
+        self._refresh_inputs()
+        cache_path = self._cache_path(contract_path)
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    report = ContractComplianceReport.from_dict(load_json(f.read()))
+                report.contract_name = contract_name
+                report.contract_path = contract_path
+                report.timestamp = datetime.now()
+                # Mark as recently used for eviction
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                return report
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        report = self._run_checks(contract_path, contract_name)
+        
+        # Only cache clean runs; errors may be transient
+        if (cache_path is not None and not report.load_error
+                and not any(check.error for check in report.checks.values())):
+            self._write_cache(cache_path, report)
+        
+        return report
+    
+    def _run_checks(self,
+                    contract_path: str,
+                    contract_name: str) -> ContractComplianceReport:
+        """
+        Load a contract and run all applicable article checks.
+        
+        Args:
+            contract_path: Path to contract OWL file
+            contract_name: Human-readable name
+            
+        Returns:
+            ContractComplianceReport object
+        """
         report = ContractComplianceReport(contract_name, contract_path)
         
+        # Filename detection is a string check; it avoids the ASK queries
+        contract_type = contract_type_from_name(contract_path)
+        
         # Load contract
         g, error = self.load_contract(contract_path)
         if error:
@@ -289,8 +807,9 @@ class DataActComplianceChecker:
         
         report.total_triples = len(g)
         
-        # Detect contract type
-        contract_type = self.detect_contract_type(g, contract_path)
+        # Fall back to detecting contract type from the graph
+        if contract_type == 'UNKNOWN':
+            contract_type = self.detect_contract_type(g)
 
         report.contract_type = contract_type
         
@@ -309,33 +828,78 @@ class DataActComplianceChecker:
         return report
     
     def check_multiple_contracts(self, 
-                                 contract_paths: List[str]) -> List[ContractComplianceReport]:
+                                 contract_paths: List[str],
+                                 max_workers: Optional[int] = None,
+                                 contract_names: Optional[List[str]] = None) -> List[ContractComplianceReport]:
         """
         Check multiple contracts for compliance.
         
+        Contracts are independent, so they are checked in parallel worker
+        processes (rdflib holds the GIL, so threads would not help). Each
+        worker builds its own checker once and reuses it for every contract
+        it receives, configured with this checker's paths and article
+        mappings.
+        
         Args:
             contract_paths: List of paths to contract OWL files
+            max_workers: Number of worker processes (default: CPU count).
+                Use 1 to check contracts sequentially in this process.
+            contract_names: Optional human-readable names, one per path
             
         Returns:
-            List of ContractComplianceReport objects
+            List of ContractComplianceReport objects, in input order. A
+            contract whose check raised (including a crashed worker) gets
+            a report with load_error set instead of aborting the batch.
         """
-        reports = []
+        if contract_names is None:
+            contract_names = [None] * len(contract_paths)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(contract_paths))
         
-        for contract_path in contract_paths:
-            report = self.check_contract(contract_path)
-            reports.append(report)
+        if max_workers <= 1:
+            reports = []
+            for path, name in zip(contract_paths, contract_names):
+                try:
+                    reports.append(self.check_contract(path, name))
+                except Exception as e:
+                    reports.append(_failed_report(path, name, e))
+            return reports
         
-        return reports
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(
+                str(self.base_ontology_path),
+                str(self.queries_dir),
+                str(self.cache_dir) if self.cache_dir is not None else None,
+                self.article_mappings,
+            ),
+        ) as executor:
+            futures = [
+                executor.submit(_check_contract_worker, path, name)
+                for path, name in zip(contract_paths, contract_names)
+            ]
+            reports = []
+            for future, path, name in zip(futures, contract_paths, contract_names):
+                try:
+                    reports.append(future.result())
+                except Exception as e:
+                    reports.append(_failed_report(path, name, e))
+            return reports
     
     def check_directory(self, 
                         directory_path: str,
-                        pattern: str = "*.owl") -> List[ContractComplianceReport]:
+                        pattern: str = "*.owl",
+                        max_workers: Optional[int] = None) -> List[ContractComplianceReport]:
         """
         Check all contracts in a directory.
         
         Args:
             directory_path: Path to directory containing contracts
             pattern: File pattern to match (default: *.owl)
+            max_workers: Number of worker processes (default: CPU count).
+                Use 1 to check contracts sequentially in this process.
             
         Returns:
             List of ContractComplianceReport objects
@@ -351,7 +915,42 @@ class DataActComplianceChecker:
             print(f"⚠️  No contract files found matching '{pattern}' in {directory_path}")
             return []
         
-        return self.check_multiple_contracts([str(f) for f in contract_files])
+        return self.check_multiple_contracts(
+            [str(f) for f in contract_files], max_workers=max_workers
+        )
+
+
+def _failed_report(contract_path: str,
+                   contract_name: Optional[str],
+                   error: Exception) -> ContractComplianceReport:
+    """Report for a contract whose check raised instead of completing"""
+    report = ContractComplianceReport(
+        contract_name if contract_name is not None else Path(contract_path).stem,
+        contract_path,
+    )
+    report.load_error = f"Error checking contract: {error!r}"
+    return report
+
+
+# Per-process checker used by check_multiple_contracts worker processes
+_worker_checker: Optional[DataActComplianceChecker] = None
+
+
+def _init_worker(base_ontology_path: str,
+                 queries_dir: str,
+                 cache_dir: Optional[str],
+                 article_mappings: Dict[str, List[Tuple[str, str, str]]]):
+    """Build the checker once per worker process"""
+    global _worker_checker
+    _worker_checker = DataActComplianceChecker(
+        base_ontology_path, queries_dir, cache_dir, article_mappings
+    )
+
+
+def _check_contract_worker(contract_path: str,
+                           contract_name: Optional[str] = None) -> ContractComplianceReport:
+    """Check a single contract with the worker's checker"""
+    return _worker_checker.check_contract(contract_path, contract_name)
 
 
 class ComplianceReporter:
@@ -388,7 +987,7 @@ class ComplianceReporter:
         
         for article_id, check in report.checks.items():
             status_icon = "✅" if check.compliant else "❌"
-            status_text = "PASS" if check.compliant else f"FAIL ({len(check.violations)} violations)"
+            status_text = "PASS" if check.compliant else f"FAIL ({check.violation_count} violations)"
             
             print(f"\n{status_icon} Article {article_id}: {check.article_name}")
             print(f"   Status: {status_text}")
@@ -397,7 +996,7 @@ class ComplianceReporter:
             if check.error:
                 print(f"   ⚠️  Error: {check.error}")
             
-            if verbose and check.violations:
+            if verbose and check.violation_count:
                 print(f"\n   Violations:")
                 for i, violation in enumerate(check.violations, 1):
                     print(f"   [{i}] {violation.get('violationType', 'UNKNOWN')}")
@@ -450,7 +1049,7 @@ class ComplianceReporter:
                 print(f"   ⚠️  Error: {report.load_error}")
             else:
                 for article_id, check in report.checks.items():
-                    check_status = "✅" if check.compliant else f"❌ ({len(check.violations)})"
+                    check_status = "✅" if check.compliant else f"❌ ({check.violation_count})"
                     print(f"      Article {article_id}: {check_status}")
         
         print("\n" + "-" * 80)
@@ -465,24 +1064,26 @@ class ComplianceReporter:
     
     @staticmethod
     def export_json(reports: List[ContractComplianceReport], 
-                    output_path: str):
+                    output_path: str,
+                    fingerprint: Optional[str] = None):
         """
         Export reports to JSON file.
         
         Args:
             reports: List of ContractComplianceReport objects
             output_path: Path to output JSON file
+            fingerprint: Optional compute_fingerprint() of the checked inputs
         """
         data = {
             'timestamp': datetime.now().isoformat(),
+            'fingerprint': fingerprint,
             'total_contracts': len(reports),
             'compliant_contracts': sum(1 for r in reports if r.overall_compliant),
             'total_violations': sum(r.total_violations for r in reports),
             'reports': [r.to_dict() for r in reports]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(data, output_path, indent=True)
         
         print(f"✅ Report exported to: {output_path}")
 
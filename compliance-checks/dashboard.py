@@ -4,9 +4,9 @@ EU Data Act Compliance Dashboard - Streamlit Application
 
 import streamlit as st
 import pandas as pd
-import json
+import os
 import sys
-import plotly.express as px
+import plotly.graph_objects as go
 from pathlib import Path
 from datetime import datetime
 
@@ -25,12 +25,28 @@ st.caption("Automated compliance monitoring under Regulation (EU) 2023/2854")
 # --------------------------------------------------------------
 # PROJECT ROOT AND DEFAULT PATHS
 # --------------------------------------------------------------
-base_path = Path(__file__).resolve().parent.parent
-default_contracts_rel = "compliance-checks/contracts"
-contracts_dir = (base_path / default_contracts_rel).resolve()
-reports_dir = contracts_dir.parent / "compliance-reports"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from compliance_checker import load_json
 
-sys.path.insert(0, str(base_path / "compliance-checks"))
+# Input and output locations come from the runner so both sides agree
+from run_compliance_check import REPORTS_DIR, current_fingerprint
+
+reports_dir = Path(REPORTS_DIR)
+
+ARTICLE_URL = "https://eur-lex.europa.eu/eli/reg/2023/2854/oj#d1e{anchor}"
+
+VIOLATION_COLUMNS = ["Contract", "Type", "Article", "Article Name", "Violation Type", "Details"]
+CONTRACT_COLUMNS = ["Contract", "Type", "Violations", "Compliant"]
+ARTICLE_COLUMNS = ["Status", "Article", "Name", "Violations", "Link"]
+
+# Low-cardinality columns; categoricals ship to the browser dictionary-encoded
+VIOLATION_CATEGORIES = dict.fromkeys(["Type", "Article", "Article Name", "Violation Type"], "category")
+CONTRACT_CATEGORIES = dict.fromkeys(["Type", "Compliant"], "category")
+
+SUMMARY_OPTION = "📊 General Summary"
+
+# Only the latest report is shown; keep a few recent ones cached per function
+REPORT_CACHE_ENTRIES = 4
 
 # --------------------------------------------------------------
 # SIDEBAR CONFIGURATION
@@ -44,13 +60,25 @@ def run_compliance_check_direct():
     """Execute compliance checker by importing directly."""
     try:
         # Importar el módulo
-        from run_compliance_check import main as run_compliance
+        from run_compliance_check import (
+            main as run_compliance,
+            create_checker,
+            EXIT_CHECK_FAILED,
+        )
         
         # Crear carpeta de reportes si no existe
         reports_dir.mkdir(parents=True, exist_ok=True)
         
-        # Ejecutar
-        run_compliance()
+        # Reuse one checker per session: the base ontology and prepared
+        # queries are loaded once and only reloaded after they are edited
+        if st.session_state.get("checker") is None:
+            st.session_state.checker = create_checker()
+        
+        # Ejecutar (in-process: worker pools would rebuild the checker
+        # and forking the Streamlit server is not safe)
+        exit_code = run_compliance(checker=st.session_state.checker, max_workers=1)
+        if exit_code == EXIT_CHECK_FAILED:
+            return False, "❌ Some contracts could not be checked; see the report for details"
         
         return True, "✅ Compliance check completed successfully"
     except Exception as e:
@@ -59,21 +87,162 @@ def run_compliance_check_direct():
         return False, f"❌ Error: {str(e)}\n\n{error_details}"
 
 
+@st.cache_data(show_spinner=False, max_entries=REPORT_CACHE_ENTRIES)
+def read_report(report_path: str, mtime_ns: int):
+    """Parse a JSON report; cached until the file's mtime changes."""
+    # Parsed in one shot on purpose: every view needs the full contract
+    # list before rendering, and orjson's whole-buffer parse is faster
+    # than streaming the same bytes through an incremental parser.
+    with open(report_path, "rb") as f:
+        return load_json(f.read())
+
+
 def load_latest_report(reports_dir: Path):
     """Load the most recent JSON report if available."""
-    if not reports_dir.exists():
+    # scandir entries cache their stat result, so each file is stat'ed once
+    # and only the newest entry is kept while iterating
+    try:
+        with os.scandir(reports_dir) as it:
+            latest = max(
+                (
+                    (entry.stat().st_mtime_ns, entry.path, entry.name)
+                    for entry in it
+                    if entry.name.endswith(".json") and entry.is_file()
+                ),
+                default=None,
+            )
+    except FileNotFoundError:
         return None, None
-    report_files = sorted(
-        reports_dir.glob("*.json"),
-        key=lambda x: x.stat().st_mtime,
-        reverse=True,
-    )
-    if not report_files:
+    if latest is None:
         return None, None
-    selected_report = report_files[0]
-    with open(selected_report, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data, selected_report.name
+    mtime_ns, report_path, report_name = latest
+    data = read_report(report_path, mtime_ns)
+    return data, report_name
+
+
+@st.cache_resource(show_spinner=False, max_entries=REPORT_CACHE_ENTRIES)
+def build_tables(report_id: str, _data: dict):
+    """
+    Build every table derived from a report once (cached per report).
+
+    The report is walked in a single pass that also accumulates the
+    summary counters. The frames are only displayed, never mutated, so
+    they are held as resources and reruns reuse them without a copy.
+
+    Returns (violations_df, contracts_df, counts).
+    """
+    # Rows are plain tuples; from_records avoids per-row dict hashing
+    violation_rows = []
+    contract_rows = []
+    n_compliant = 0
+    n_violations = 0
+    for r in _data["reports"]:
+        if r["overall_compliant"]:
+            n_compliant += 1
+        n_violations += r["total_violations"]
+        contract_rows.append(
+            (
+                r["contract_name"],
+                r["contract_type"],
+                r["total_violations"],
+                "✅ Yes" if r["overall_compliant"] else "❌ No",
+            )
+        )
+        violation_rows.extend(
+            (
+                r["contract_name"],
+                r["contract_type"],
+                art,
+                check["article_name"],
+                v.get("violationType", "Unknown"),
+                v.get("details", ""),
+            )
+            for art, check in r["checks"].items()
+            if not check["compliant"]
+            for v in check["violations"]
+        )
+    counts = {
+        "total": len(contract_rows),
+        "compliant": n_compliant,
+        "non_compliant": len(contract_rows) - n_compliant,
+        "violations": n_violations,
+    }
+    violations_df = pd.DataFrame.from_records(
+        violation_rows, columns=VIOLATION_COLUMNS
+    ).astype(VIOLATION_CATEGORIES)
+    contracts_df = pd.DataFrame.from_records(
+        contract_rows, columns=CONTRACT_COLUMNS
+    ).astype(CONTRACT_CATEGORIES)
+    return violations_df, contracts_df, counts
+
+
+@st.cache_data(show_spinner=False)
+def format_timestamp(iso_timestamp: str) -> str:
+    """Format a report's ISO timestamp for display (cached per value)."""
+    return datetime.fromisoformat(iso_timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@st.cache_data(show_spinner=False)
+def build_pie(compliant: int, non_compliant: int):
+    """Build the compliance distribution pie (cached per count pair)."""
+    fig = go.Figure(
+        go.Pie(
+            labels=["Compliant", "Non-Compliant"],
+            values=[compliant, non_compliant],
+            marker_colors=["#2ecc71", "#e74c3c"],
+            sort=False,
+        )
+    )
+    fig.update_layout(title="Overall Compliance Distribution", legend_title_text="Status")
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=REPORT_CACHE_ENTRIES)
+def index_contracts(report_id: str, _data: dict):
+    """
+    Map contract labels to their report entries (cached per report).
+
+    Returns (options, by_label): the sidebar options (summary first, then
+    one label per contract in report order) and the label index, both
+    built in one pass. Names are derived from file names and may collide;
+    the first keeps its name and later ones get a " (2)", " (3)"... suffix
+    so no contract is hidden. cache_resource hands back the same objects
+    on every rerun instead of copies; they are only read.
+    """
+    by_label = {}
+    for r in _data["reports"]:
+        label = r["contract_name"]
+        n = 1
+        while label in by_label:
+            n += 1
+            label = f"{r['contract_name']} ({n})"
+        by_label[label] = r
+    return [SUMMARY_OPTION, *by_label], by_label
+
+
+@st.cache_resource(show_spinner=False, max_entries=REPORT_CACHE_ENTRIES)
+def build_article_tables(report_id: str, _contracts: dict):
+    """
+    Precompute one article summary table per contract (cached per report).
+
+    Takes the label index from index_contracts and returns
+    {label: DataFrame}. Held as a resource so reruns reuse the same
+    frames; they are only read.
+    """
+    tables = {}
+    for label, r in _contracts.items():
+        rows = [
+            (
+                "✅" if check["compliant"] else "❌",
+                article_id,
+                check["article_name"],
+                len(check["violations"]),
+                ARTICLE_URL.format(anchor=article_id.replace(".", "")),
+            )
+            for article_id, check in r["checks"].items()
+        ]
+        tables[label] = pd.DataFrame.from_records(rows, columns=ARTICLE_COLUMNS)
+    return tables
 
 
 # --------------------------------------------------------------
@@ -90,6 +259,14 @@ if "button_clicked" not in st.session_state:
 # AUTO-RUN ON FIRST LOAD
 # --------------------------------------------------------------
 # 🚀 Auto-ejecutar si no hay datos (primer carga)
+if not st.session_state.button_clicked:
+    # Skip the run when the latest report was produced from the same inputs
+    data, report_name = load_latest_report(reports_dir)
+    if data and data.get("fingerprint") == current_fingerprint():
+        st.session_state.button_clicked = True
+        st.session_state.data = data
+        st.session_state.report_name = report_name
+
 if not st.session_state.button_clicked:
     with st.spinner("🔄 Running initial compliance check... please wait ⏳"):
         success, message = run_compliance_check_direct()
@@ -137,14 +314,23 @@ if not st.session_state.data:
 # --------------------------------------------------------------
 data = st.session_state.data
 report_name = st.session_state.report_name
-timestamp = datetime.fromisoformat(data["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+# Reports are overwritten per day, so the export timestamp disambiguates them
+report_id = f"{report_name}@{data['timestamp']}"
+timestamp = format_timestamp(data["timestamp"])
+
+# Nothing to summarize or navigate; skip all table and chart work
+if not data.get("reports"):
+    st.warning("No contracts in this report.")
+    st.caption(f"🕒 Last updated: {timestamp} · 📁 Report: `{report_name}`")
+    st.stop()
+
+contract_options, contracts_by_label = index_contracts(report_id, data)
 
 # SIDEBAR: CONTRACT NAVIGATION
 st.sidebar.header("📑 Contracts")
-contract_names = [r["contract_name"] for r in data["reports"]]
 selected_contract = st.sidebar.selectbox(
     "Select a contract:",
-    options=["📊 General Summary"] + contract_names,
+    options=contract_options,
     index=0,
 )
 st.sidebar.markdown("---")
@@ -154,7 +340,10 @@ st.sidebar.caption(f"📁 Report: `{report_name}`")
 # --------------------------------------------------------------
 # GENERAL SUMMARY VIEW
 # --------------------------------------------------------------
-if selected_contract == "📊 General Summary":
+# Views are fragments so interactions inside one rerun only that view
+@st.fragment
+def render_summary(timestamp, violations_df, contracts_df, counts):
+    """Render the all-contracts summary."""
     st.markdown(f"**📅 Report generated on:** `{timestamp}`")
     st.divider()
 
@@ -171,25 +360,8 @@ if selected_contract == "📊 General Summary":
         """
     )
 
-    violations_data = []
-    for r in data["reports"]:
-        for art, check in r["checks"].items():
-            if not check["compliant"]:
-                for v in check["violations"]:
-                    violations_data.append(
-                        {
-                            "Contract": r["contract_name"],
-                            "Type": r["contract_type"],
-                            "Article": art,
-                            "Article Name": check["article_name"],
-                            "Violation Type": v.get("violationType", "Unknown"),
-                            "Details": v.get("details", ""),
-                        }
-                    )
-
-    if violations_data:
+    if not violations_df.empty:
         st.subheader("Detected Violations")
-        violations_df = pd.DataFrame(violations_data)
         st.dataframe(violations_df, use_container_width=True)
     else:
         st.success("✅ All contracts comply with the monitored articles.")
@@ -199,53 +371,26 @@ if selected_contract == "📊 General Summary":
     st.header("📊 Compliance Overview")
 
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Contracts", data["total_contracts"])
-    col2.metric("Compliant Contracts", data["compliant_contracts"])
-    col3.metric("Non-Compliant", data["total_contracts"] - data["compliant_contracts"])
-    col4.metric("Total Violations", data["total_violations"])
-
-    summary_df = pd.DataFrame(
-        [
-            {"Status": "Compliant", "Count": data["compliant_contracts"]},
-            {
-                "Status": "Non-Compliant",
-                "Count": data["total_contracts"] - data["compliant_contracts"],
-            },
-        ]
-    )
-    fig = px.pie(
-        summary_df,
-        names="Status",
-        values="Count",
-        title="Overall Compliance Distribution",
-        color="Status",
-        color_discrete_map={"Compliant": "#2ecc71", "Non-Compliant": "#e74c3c"},
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    col1.metric("Total Contracts", counts["total"])
+    col2.metric("Compliant Contracts", counts["compliant"])
+    col3.metric("Non-Compliant", counts["non_compliant"])
+    col4.metric("Total Violations", counts["violations"])
+
+    fig = build_pie(counts["compliant"], counts["non_compliant"])
+    st.plotly_chart(fig, use_container_width=True, key="overall_pie")
 
     st.divider()
 
     st.header("📋 Contract Overview")
-    contracts = []
-    for r in data["reports"]:
-        contracts.append(
-            {
-                "Contract": r["contract_name"],
-                "Type": r["contract_type"],
-                "Violations": r["total_violations"],
-                "Compliant": "✅ Yes" if r["overall_compliant"] else "❌ No",
-            }
-        )
-    contracts_df = pd.DataFrame(contracts)
     st.dataframe(contracts_df, use_container_width=True)
     st.divider()
 
 # --------------------------------------------------------------
 # INDIVIDUAL CONTRACT VIEW
 # --------------------------------------------------------------
-else:
-    contract = next(r for r in data["reports"] if r["contract_name"] == selected_contract)
-
+@st.fragment
+def render_contract(contract, article_table):
+    """Render the article checks of a single contract."""
     st.markdown(f"### 🧾 {contract['contract_name']}")
     colA, colB, colC = st.columns(3)
     colA.markdown(f"**Type:** `{contract['contract_type']}`")
@@ -253,25 +398,42 @@ else:
 
     st.markdown("#### 📑 Article Checks")
 
-    for article_id, check in contract["checks"].items():
-        compliant = check["compliant"]
-        article_url = (
-            f"https://eur-lex.europa.eu/eli/reg/2023/2854/oj#d1e{article_id.replace('.', '')}"
-        )
-        header = (
-            f"✅ [Article {article_id}: {check['article_name']}]({article_url})"
-            if compliant
-            else f"❌ [Article {article_id}: {check['article_name']}]({article_url})"
-        )
-        with st.expander(header, expanded=not compliant):
-            if compliant:
-                st.success("This article is compliant.")
-            else:
-                st.error(f"**{len(check['violations'])} violation(s) detected.**")
-                for i, v in enumerate(check["violations"], start=1):
-                    st.markdown(f"**Violation {i}: {v.get('violationType', 'Unknown')}**")
-                    st.write(v.get("details", "No details provided."))
+    # One table widget for all articles; details only for the selected row
+    event = st.dataframe(
+        article_table,
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Link": st.column_config.LinkColumn(display_text="EUR-Lex")},
+        key=f"articles_{contract['contract_path']}",
+        on_select="rerun",
+        selection_mode="single-row",
+    )
+
+    selected_rows = event.selection.rows
+    if not selected_rows:
+        st.caption("Select an article to see its details.")
+    else:
+        article_id = article_table["Article"].iat[selected_rows[0]]
+        check = contract["checks"][article_id]
+        if check["compliant"]:
+            st.success(f"Article {article_id} is compliant.")
+        else:
+            st.error(f"**Article {article_id}: {len(check['violations'])} violation(s) detected.**")
+            for i, v in enumerate(check["violations"], start=1):
+                st.markdown(f"**Violation {i}: {v.get('violationType', 'Unknown')}**")
+                st.write(v.get("details", "No details provided."))
 
     st.divider()
 
+
+if selected_contract == SUMMARY_OPTION:
+    # Tables are only fetched for the summary view
+    violations_df, contracts_df, counts = build_tables(report_id, data)
+    render_summary(timestamp, violations_df, contracts_df, counts)
+else:
+    render_contract(
+        contracts_by_label[selected_contract],
+        build_article_tables(report_id, contracts_by_label)[selected_contract],
+    )
+
 st.caption("© 2025 - EU Data Act Compliance Toolkit | CC BY-SA 4.0 License")
\ No newline at end of file
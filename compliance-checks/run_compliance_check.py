@@ -4,6 +4,7 @@ EU Data Act Compliance Checker - Main Script
 Automatically run compliance checks on all contract scenarios found in the 'contracts' folder.
 """
 
+import functools
 import os
 import sys
 from datetime import datetime
@@ -11,67 +12,167 @@ from pathlib import Path
 
 # Import compliance checker
 sys.path.insert(0, str(Path(__file__).parent))
-from compliance_checker import DataActComplianceChecker, ComplianceReporter
-
-
-def main():
-    """Main execution function"""
-
-    print("=" * 80)
-    print("EU DATA ACT COMPLIANCE CHECKER")
-    print("=" * 80)
-    print()
-
-    # Base directories
-    base_path = "compliance-checks"
-    contracts_dir = os.path.join(base_path, "contracts")
-
-    # Initialize checker
+from compliance_checker import (
+    DataActComplianceChecker,
+    ComplianceReporter,
+    compute_fingerprint,
+    load_json,
+)
+
+# Default locations, resolved from this file so the script (and the
+# dashboard importing it) works from any working directory
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+CONTRACTS_DIR = os.path.join(BASE_PATH, "contracts")
+QUERIES_DIR = os.path.join(BASE_PATH, "queries")
+REPORTS_DIR = os.path.join(BASE_PATH, "compliance-reports")
+CACHE_DIR = os.path.join(BASE_PATH, ".compliance_cache")
+BASE_ONTOLOGY_PATH = os.path.join(os.path.dirname(BASE_PATH), "DAOnt.owl")
+
+# Exit code when contracts could not be checked (1 means non-compliant)
+EXIT_CHECK_FAILED = 2
+
+# Optional sidecar in the contracts folder: {"<file>.owl": "description"}
+DESCRIPTIONS_FILE = "descriptions.json"
+DEFAULT_DESCRIPTION = "Auto-detected contract file"
+
+
+def create_checker():
+    """Create a checker for the default ontology and queries"""
+    return DataActComplianceChecker(
+        base_ontology_path=BASE_ONTOLOGY_PATH,
+        queries_dir=QUERIES_DIR,
+        cache_dir=CACHE_DIR,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_descriptions(path, mtime_ns):
+    """Parse a descriptions sidecar; cached until the file's mtime changes"""
+    with open(path, "rb") as f:
+        return load_json(f.read())
+
+
+def load_descriptions(contracts_dir=CONTRACTS_DIR):
+    """
+    Load the optional contract descriptions sidecar of a directory.
+
+    A missing, unreadable or malformed file yields no descriptions, so
+    every contract falls back to DEFAULT_DESCRIPTION.
+    """
+    path = os.path.join(contracts_dir, DESCRIPTIONS_FILE)
     try:
-        checker = DataActComplianceChecker(
-            base_ontology_path="data_act_ontology.owl",
-            queries_dir=os.path.join(base_path, "queries")
-        )
-        print("✅ Compliance checker initialized successfully")
-    except Exception as e:
-        print(f"❌ Error initializing checker: {e}")
-        return 1
-
-    # Automatically find all OWL contract files
-    contracts = []
-    for file_name in os.listdir(contracts_dir):
-        if file_name.endswith(".owl"):
-            contract_path = os.path.join(contracts_dir, file_name)
-            contracts.append({
-                "path": contract_path,
-                "name": file_name.replace(".owl", "").replace("-", " ").title(),
-                "description": "Auto-detected contract file"
-            })
+        descriptions = _read_descriptions(path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring {DESCRIPTIONS_FILE}: {e}")
+        return {}
+    if not isinstance(descriptions, dict):
+        print(f"⚠️  Ignoring {DESCRIPTIONS_FILE}: expected a JSON object")
+        return {}
+    return descriptions
+
+
+def current_fingerprint():
+    """Fingerprint every input a report depends on (contracts, queries, ontology)"""
+    return compute_fingerprint(CONTRACTS_DIR, QUERIES_DIR, BASE_ONTOLOGY_PATH)
+
+
+def discover_contracts(contracts_dir=CONTRACTS_DIR):
+    """Find all OWL contract files in a directory"""
+    descriptions = load_descriptions(contracts_dir)
+    with os.scandir(contracts_dir) as it:
+        return [
+            {
+                "path": entry.path,
+                "name": entry.name[:-len(".owl")].replace("-", " ").title(),
+                "description": descriptions.get(entry.name, DEFAULT_DESCRIPTION)
+            }
+            for entry in it
+            if entry.name.endswith(".owl")
+        ]
+
+
+def run_all(checker, contracts_dir=CONTRACTS_DIR, max_workers=None):
+    """
+    Check every contract in a directory with an existing checker.
+
+    Reusing the checker keeps the parsed base ontology and prepared
+    queries across runs. Contracts are checked in parallel worker
+    processes unless max_workers is 1.
+
+    Returns the reports (empty if there are no contracts), or None if the
+    batch could not be run at all.
+    """
+    contracts = discover_contracts(contracts_dir)
 
     if not contracts:
         print("⚠️  No contract files found in the 'contracts' folder.")
-        return 0
+        return []
 
     print(f"\n📁 Found {len(contracts)} contract scenarios to check\n")
 
-    # Check each contract
-    reports = []
-    for c in contracts:
-        print(f"🔍 Checking: {c['name']}")
+    try:
+        reports = checker.check_multiple_contracts(
+            [c["path"] for c in contracts],
+            max_workers=max_workers,
+            contract_names=[c["name"] for c in contracts],
+        )
+    except Exception as e:
+        print(f"❌ Error checking contracts: {e}")
+        return None
+
+    for c, report in zip(contracts, reports):
+        print(f"🔍 Checked: {c['name']}")
         print(f"   Path: {c['path']}")
         print(f"   Description: {c['description']}")
+        if report.load_error:
+            print(f"   ❌ Error: {report.load_error}")
+        else:
+            status = "✅ COMPLIANT" if report.overall_compliant else "❌ NON-COMPLIANT"
+            print(f"   {status} ({report.total_violations} violations)")
+        print()
+
+    return reports
+
+
+def main(checker=None, max_workers=None):
+    """
+    Main execution function.
+
+    Args:
+        checker: Optional DataActComplianceChecker to reuse; one is
+            created when omitted
+        max_workers: Worker processes for contract checks (default: CPU
+            count; 1 checks sequentially in this process)
+
+    Returns:
+        0 if all checked contracts comply, 1 if any violates a check,
+        EXIT_CHECK_FAILED if any contract could not be checked
+    """
+
+    print("=" * 80)
+    print("EU DATA ACT COMPLIANCE CHECKER")
+    print("=" * 80)
+    print()
+
+    # Initialize checker
+    if checker is None:
         try:
-            report = checker.check_contract(c["path"], c["name"])
-            reports.append(report)
-
-            if report.load_error:
-                print(f"   ❌ Error: {report.load_error}")
-            else:
-                status = "✅ COMPLIANT" if report.overall_compliant else "❌ NON-COMPLIANT"
-                print(f"   {status} ({report.total_violations} violations)")
+            checker = create_checker()
+            print("✅ Compliance checker initialized successfully")
         except Exception as e:
-            print(f"   ❌ Error checking contract: {e}")
-        print()
+            print(f"❌ Error initializing checker: {e}")
+            return 1
+
+    # Fingerprint inputs before checking so later edits invalidate the report
+    fingerprint = current_fingerprint()
+
+    reports = run_all(checker, max_workers=max_workers)
+    if reports is None:
+        return EXIT_CHECK_FAILED
+    if not reports:
+        return 0
 
     # Detailed reports
     print("\n" + "=" * 80)
@@ -86,18 +187,19 @@ def main():
 
     # Export JSON
     date = datetime.now().strftime("%Y-%m-%d")
-    output_dir = os.path.join(base_path, "compliance-reports")
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f"compliance-report-{date}.json")
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    output_file = os.path.join(REPORTS_DIR, f"compliance-report-{date}.json")
 
     try:
-        ComplianceReporter.export_json(reports, output_file)
+        ComplianceReporter.export_json(reports, output_file, fingerprint)
         print(f"\n📤 Report exported to: {output_file}")
     except Exception as e:
         print(f"⚠️  Could not export JSON: {e}")
 
     # Exit code
-    all_compliant = all(r.overall_compliant for r in reports if not r.load_error)
+    if any(r.load_error for r in reports):
+        return EXIT_CHECK_FAILED
+    all_compliant = all(r.overall_compliant for r in reports)
     return 0 if all_compliant else 1
 
 